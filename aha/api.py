@@ -1,11 +1,16 @@
 """Web scraping API."""
 
-from functools import cache
+from datetime import date
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from itertools import islice, zip_longest
 from logging import getLogger
 from typing import Any, Iterable, Iterator, Optional, Union
 
-from bs4 import BeautifulSoup
-from requests import get, post
+from lxml.etree import XMLSyntaxError, XPath
+from lxml.html import HTMLParser, HtmlElement
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
 
 from aha.exceptions import AmbiguousLocations
 from aha.exceptions import HTTPError
@@ -18,9 +23,18 @@ from aha.types import HouseNumber, Location, Pickup, Request
 __all__ = ["LOGGER", "get_locations", "find_location", "get_pickups"]
 
 
+CHUNK_SIZE = 64 * 1024
+FILL = object()
 LOGGER = getLogger("aha-webscraper")
 PARAMS = {"von": "A", "bis": "Z"}
+PICKUP_LOCATIONS = XPath('//select[@id="ladeort"]/option/@value', smart_strings=False)
+STREET_SELECT = XPath('//select[@id="strasse"]')
+STREETS = XPath("./option/@value", smart_strings=False)
+TIMEOUT = 15
 URL = "https://www.aha-region.de/abholtermine/abfuhrkalender"
+SESSION = Session()
+SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 
 def frames(iterable: Iterable[Any], size: int) -> Iterator[tuple[Any, ...]]:
@@ -29,95 +43,150 @@ def frames(iterable: Iterable[Any], size: int) -> Iterator[tuple[Any, ...]]:
     if size < 1:
         raise ValueError("Size must be >= 1")
 
-    frame = []
+    for frame in zip_longest(*[iter(iterable)] * size, fillvalue=FILL):
+        if frame[-1] is FILL:
+            frame = [item for item in frame if item is not FILL]
+            LOGGER.warning("Last frame not filled: %s", frame)
+            return
 
-    for item in iterable:
-        frame.append(item)
+        yield frame
 
-        if len(frame) == size:
-            yield tuple(frame)
-            frame.clear()
 
-    if frame:
-        LOGGER.warning("Last frame not filled: %s", frame)
+def get_document(response: Response) -> HtmlElement:
+    """Parses the HTML document while the response is being received."""
 
+    # Without an HTTP charset, let libxml2 read the document's meta charset.
+    if "charset" in response.headers.get("Content-Type", "").lower():
+        parser = HTMLParser(encoding=response.encoding)
+    else:
+        parser = HTMLParser()
 
-def _get_locations(municipality) -> Iterator[Location]:
-    """Yields locations."""
-    PARAMS['gemeinde'] = municipality
-    if (response := get(URL, params=PARAMS)).status_code != 200:
+    with response:
+        for chunk in response.iter_content(CHUNK_SIZE):
+            parser.feed(chunk)
+
+    try:
+        root = parser.close()
+    except XMLSyntaxError as error:
+        raise ScrapingError(f"Could not parse document: {error}", None) from None
+
+    if root is None:
+        raise ScrapingError("Empty document", None)
+
+    return root
+
+
+def _get_locations(municipality) -> frozenset[Location]:
+    """Returns a set of locations."""
+
+    params = {**PARAMS, "gemeinde": municipality}
+    response = SESSION.get(URL, params=params, stream=True, timeout=TIMEOUT)
+
+    if response.status_code != 200:
         raise HTTPError.from_response(response)
 
-    document = BeautifulSoup(response.text, "html5lib")
+    document = get_document(response)
+
+    if not (selects := STREET_SELECT(document)):
+        raise ScrapingError('Could not find select "strasse"', document)
+
+    return frozenset(map(Location.from_string, STREETS(selects[0])))
+
 
-    if (select := document.find(id="strasse")) is None:
-        raise ScrapingError('Could not find select element with id "strasse"', document)
+@lru_cache(maxsize=64)
+def _get_locations_of_day(municipality: str, day: date) -> frozenset[Location]:
+    """Returns a set of locations for the given day."""
 
-    for option in select.find_all("option"):
-        yield Location.from_string(option["value"])
+    return _get_locations(municipality)
 
 
-@cache
 def get_locations(municipality) -> frozenset[Location]:
-    """Returns a set of locations."""
+    """Returns a set of locations cached for the day."""
+
+    return _get_locations_of_day(municipality, date.today())
+
+
+@lru_cache(maxsize=64)
+def index_locations(locations: frozenset[Location]) -> dict[str, list[Location]]:
+    """Maps lower-case street names to their locations."""
+
+    index: dict[str, list[Location]] = {}
+
+    for location in locations:
+        index.setdefault(location.name.lower(), []).append(location)
 
-    return frozenset(_get_locations(municipality))
+    return index
 
 
 def find_location(name: str, *, district: Optional[str] = None,  municipality: Optional[str] = 'Hannover') -> Location:
     """Yields locations."""
 
-    try:
-        location, *superfluous = sorted(
+    index = index_locations(get_locations(municipality=municipality))
+    needle = name.lower()
+    # Exact street names are the common case and need no regex scan.
+    candidates = index.get(needle, [])
+
+    if district is not None:
+        candidates = [
+            location for location in candidates if location.district == district
+        ]
+
+    if not candidates:
+        # A literal prefix always matches the pattern, so try it first.
+        pattern = street_regex(name)
+        candidates = [
             location
-            for location in get_locations(municipality=municipality)
-            if street_regex(name).match(location.name)
-            and (district is None or location.district == district)
-        )
-    except ValueError:
-        raise NoLocationFound(name) from None
+            for street, locations in index.items()
+            if street.startswith(needle) or pattern.match(street)
+            for location in locations
+            if district is None or location.district == district
+        ]
 
-    if superfluous:
-        raise AmbiguousLocations(location, *superfluous)
+    if not candidates:
+        raise NoLocationFound(name)
 
-    return location
+    if len(candidates) > 1:
+        raise AmbiguousLocations(*sorted(candidates))
 
+    return candidates[0]
 
-def parse_pickups(document: BeautifulSoup) -> Iterator[Pickup]:
-    """Parses the pickups."""
 
-    if (table := document.find("table")) is None:
-        raise ScrapingError("Could not find table element", document)
+def parse_pickups(table: HtmlElement) -> list[Pickup]:
+    """Parses the pickups from the pickups table."""
 
-    # Discard spacing and buttons and skip header row.
-    for _, caption, dates, _ in frames(table.find_all("tr")[1:], 4):
-        yield Pickup.from_elements(caption, dates)
+    rows = islice(table.iterfind(".//tr"), 1, None)  # Skip header row.
+    # Discard spacing and buttons.
+    return [
+        Pickup.from_elements(caption, dates) for _, caption, dates, _ in frames(rows, 4)
+    ]
 
 
-def get_pickup_locations(document: BeautifulSoup) -> Iterator[str]:
-    """Yields available pickup locations."""
+def get_pickup_locations(document: HtmlElement) -> list[str]:
+    """Returns available pickup locations."""
 
-    for element in document.find(id="ladeort").find_all("option"):
-        yield element["value"]
+    return PICKUP_LOCATIONS(document)
 
 
-def _get_pickups(request: Request) -> Iterator[Pickup]:
-    """Yields pickups for the given request."""
+def _get_pickups(request: Request) -> list[Pickup]:
+    """Returns pickups for the given request."""
 
-    if (response := post(URL, data=request.to_json())).status_code != 200:
+    response = SESSION.post(URL, data=request.to_json(), stream=True, timeout=TIMEOUT)
+
+    if response.status_code != 200:
         raise HTTPError.from_response(response)
 
-    document = BeautifulSoup(response.text, "html5lib")
+    document = get_document(response)
 
-    try:
-        yield from parse_pickups(document)
-    except ScrapingError as error:
-        try:
-            pickup_location, *_ = get_pickup_locations(document)
-        except ValueError:
-            raise error
+    if (table := document.find(".//table")) is not None:
+        return parse_pickups(table)
+
+    # Without a table, AHA asks to choose a pickup location first.
+    if request.pickup_location is None and (
+        pickup_locations := get_pickup_locations(document)
+    ):
+        return _get_pickups(request.change_location(pickup_locations[0]))
 
-        yield from _get_pickups(request.change_location(pickup_location))
+    raise ScrapingError("Could not find table element", document)
 
 
 def get_pickups(
@@ -126,7 +195,7 @@ def get_pickups(
     *,
     municipality:Optional[str]= "Hannover",
     pickup_location: Optional[str] = None,
-) -> Iterator[Pickup]:
+) -> list[Pickup]:
     """Returns pickups for the given location."""
 
     if isinstance(house_number, str):
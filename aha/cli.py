@@ -1,8 +1,13 @@
 """Command line program."""
 
 from argparse import ArgumentParser, Namespace
-from json import dumps
+from json import dumps as json_dumps
 from logging import DEBUG, WARNING, basicConfig
+from sys import stdout
+
+from lxml.html import tostring
+from orjson import OPT_APPEND_NEWLINE, OPT_INDENT_2, dumps
+from requests import RequestException
 
 from aha.api import LOGGER, find_location, get_pickups
 from aha.exceptions import AmbiguousLocations
@@ -50,18 +55,35 @@ def main() -> int:
             LOGGER.warning(location.name)
 
         return 2
+    except RequestException as error:
+        LOGGER.error("Request error: %s", error)
+        return 3
 
     try:
         pickups = get_pickups(location, args.houseno,municipality=args.municipality)
     except HTTPError as error:
         LOGGER.error("HTTP error: %s (%i)", error.text, error.status_code)
         return 3
+    except RequestException as error:
+        LOGGER.error("Request error: %s", error)
+        return 3
     except ScrapingError as error:
         LOGGER.error("Scraping error: %s", error.message)
-        LOGGER.debug("HTML text:\n%s", error.document)
+
+        if error.document is not None:
+            LOGGER.debug("HTML text:\n%s", tostring(error.document, encoding=str))
+
         return 4
 
-    print(dumps([p.to_json() for p in pickups], indent=args.indent))
+    json = [pickup.to_json() for pickup in pickups]
+
+    # orjson only supports an indentation of two spaces.
+    if args.indent not in {None, 2}:
+        print(json_dumps(json, indent=args.indent))
+        return 0
+
+    option = OPT_APPEND_NEWLINE | (OPT_INDENT_2 if args.indent else 0)
+    stdout.buffer.write(dumps(json, option=option))
     return 0
 
 
@@ -1,9 +1,9 @@
 """Common exceptions."""
 
 from __future__ import annotations
-from typing import Iterator
+from typing import Iterator, Optional
 
-from bs4 import BeautifulSoup
+from lxml.html import HtmlElement
 from requests import Response
 
 from aha.types import Location
@@ -44,7 +44,7 @@ class NoLocationFound(Exception):
 class ScrapingError(Exception):
     """Indicates an error during scraping."""
 
-    def __init__(self, message: str, document: BeautifulSoup):
+    def __init__(self, message: str, document: Optional[HtmlElement]):
         super().__init__(message)
         self.message = message
         self.document = document
@@ -1,12 +1,14 @@
 """Common functions."""
 
 from datetime import date
+from functools import lru_cache
 from typing import Union,Optional
 
 from flask import request
 
 from hwdb import Deployment
 from mdb import Address
+from requests import RequestException
 from wsgilib import JSON, JSONMessage
 
 from aha.types import Location, Pickup
@@ -20,9 +22,6 @@ from aha.exceptions import ScrapingError
 __all__ = ["by_address", "get_address", "get_cached_pickups"]
 
 
-CACHE = {}
-
-
 def by_address(address: Address) -> Union[JSON, JSONMessage]:
     """Return a WSGI response by address."""
 
@@ -35,11 +34,15 @@ def by_address(address: Address) -> Union[JSON, JSONMessage]:
             "Multiple matching locations found.",
             locations=[location.name for location in locations],
         )
+    except RequestException as error:
+        return JSONMessage("Request error.", error=str(error))
 
     try:
         pickups = get_cached_pickups(location, address.house_number, municipality=address.city)
     except HTTPError as error:
         return JSONMessage("HTTP error.", status_code=error.status_code)
+    except RequestException as error:
+        return JSONMessage("Request error.", error=str(error))
     except ScrapingError as error:
         return JSONMessage("Scraping error.", error=error.message)
 
@@ -49,35 +52,36 @@ def by_address(address: Address) -> Union[JSON, JSONMessage]:
 def get_address() -> Address:
     """Return the requested address."""
 
-    if address_id := request.json.get("address"):
+    json = request.json
+
+    if address_id := json.get("address"):
         return Address.get(Address.id == address_id)
 
-    if deployment_id := request.json.get("deployment"):
+    if deployment_id := json.get("deployment"):
         deployment = (
             Deployment.select(cascade=True).where(Deployment.id == deployment_id).get()
         )
         return deployment.address
 
     return Address(
-        street=request.json["street"],
-        house_number=request.json["houseNumber"],
-        zip_code=request.json["zipCode"],
-        city=request.json["city"],
-        district=request.json.get("district"),
+        street=json["street"],
+        house_number=json["houseNumber"],
+        zip_code=json["zipCode"],
+        city=json["city"],
+        district=json.get("district"),
     )
 
 
-def get_cached_pickups(location: Location, house_number: str,municipality:Optional[str]= 'Hannover') -> list[Pickup]:
-    """Returns cached pickups for the day."""
+@lru_cache(maxsize=1024)
+def _get_pickups_of_day(
+    day: date, location: Location, house_number: str, municipality: Optional[str]
+) -> tuple[Pickup, ...]:
+    """Returns pickups for the given request parameters and day."""
 
-    try:
-        locations = CACHE[date.today()]
-    except KeyError:
-        CACHE.clear()
-        CACHE[date.today()] = locations = {}
+    return tuple(get_pickups(location, house_number, municipality=municipality))
 
-    try:
-        return locations[location]
-    except KeyError:
-        locations[location] = pickups = list(get_pickups(location, house_number,municipality=municipality))
-        return pickups
+
+def get_cached_pickups(location: Location, house_number: str,municipality:Optional[str]= 'Hannover') -> tuple[Pickup, ...]:
+    """Returns cached pickups for the day."""
+
+    return _get_pickups_of_day(date.today(), location, house_number, municipality)
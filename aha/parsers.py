@@ -1,46 +1,40 @@
 """Common data parsers."""
 
-from datetime import date, datetime
-from functools import cache
-from re import IGNORECASE, Pattern, compile
-from typing import Iterator
+from datetime import date
+from functools import lru_cache
+from re import IGNORECASE, Pattern, compile, escape
 
-from bs4.element import Comment, NavigableString, PageElement, Tag
+from lxml.etree import XPath
+from lxml.html import HtmlElement
 
 
 __all__ = ["parse_date", "street_regex", "text_content"]
 
 
 STREET_MAP = {"strasse": "str.", "straße": "str", "Strasse": "Str.", "Straße": "Str."}
+STREET_SUFFIX = compile(f"({'|'.join(STREET_MAP)})$")
+TEXT_NODES = XPath("text()", smart_strings=False)
 
 
-def is_text_element(item: PageElement) -> bool:
-    """Determines whether the item is plain text."""
-
-    return isinstance(item, NavigableString) and not isinstance(item, Comment)
-
-
+@lru_cache(maxsize=1024)
 def parse_date(string: str) -> date:
     """Extracts dates from HTML elements."""
 
-    _, date_string = string.split(",")  # discard weekday
-    date_string = date_string.replace("*", "").strip()
-    return datetime.strptime(date_string, "%d.%m.%Y").date()
+    _, date_string = string.split(",", 1)  # discard weekday
+    day, month, year = date_string.replace("*", "").strip().split(".")
+    return date(int(year), int(month), int(day))
 
 
-@cache
+@lru_cache(maxsize=1024)
 def street_regex(street: str) -> Pattern:
     """Returns a regular expression to match the street name."""
 
-    for key, value in STREET_MAP.items():
-        if street.endswith(key):
-            street = street.replace(key, value)
-            break
-
-    return compile(street.replace(".", ".*"), flags=IGNORECASE)
+    street = STREET_SUFFIX.sub(lambda match: STREET_MAP[match.group()], street)
+    # Escape user input, but keep abbreviation dots as wildcards.
+    return compile(escape(street).replace(r"\.", ".*"), flags=IGNORECASE)
 
 
-def text_content(element: Tag) -> Iterator[str]:
-    """Extracts text content from an HTML element."""
+def text_content(element: HtmlElement) -> list[str]:
+    """Extracts the element's own text nodes, skipping comments."""
 
-    return map(str, filter(is_text_element, element.contents))
+    return TEXT_NODES(element)
@@ -1,12 +1,14 @@
 """Common data types."""
 
 from __future__ import annotations
+from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from string import ascii_letters
-from typing import NamedTuple, Optional
+from re import DOTALL, compile
+from sys import intern
+from typing import Optional
 
-from bs4.element import Tag
+from lxml.html import HtmlElement
 
 from aha.parsers import parse_date, text_content
 
@@ -14,7 +16,12 @@ from aha.parsers import parse_date, text_content
 __all__ = ["HouseNumber", "Interval", "Location", "Pickup", "Request"]
 
 
-class HouseNumber(NamedTuple):
+HOUSE_NUMBER = compile(r"(\d+)(.*)", DOTALL)
+LETTERS = compile("[A-Za-z]")
+
+
+@dataclass(frozen=True, slots=True)
+class HouseNumber:
     """Represents a house number."""
 
     number: int
@@ -28,21 +35,11 @@ class HouseNumber(NamedTuple):
     @staticmethod
     def split_number_and_suffix(string: str) -> tuple[int, str]:
         """Split off house number and suffix."""
-        number: list[str] = []
-        suffix: list[str] = []
-        index = 0
-
-        for index, char in enumerate(string):
-            if not char.isdigit():
-                break
+        if (match := HOUSE_NUMBER.match(string)) is None:
+            raise ValueError(f"Invalid house number: {string!r}")
 
-            number.append(char)
-
-        for char in string[index:]:
-            if char in ascii_letters:
-                suffix.append(char)
-
-        return int("".join(number)), "".join(suffix)
+        number, rest = match.groups()
+        return int(number), "".join(LETTERS.findall(rest))
 
 
 class Interval(str, Enum):
@@ -53,23 +50,31 @@ class Interval(str, Enum):
     TWO_WEEKS = "2x wöchentlich"
 
 
-class Location(NamedTuple):
+@dataclass(frozen=True, order=True, slots=True)
+class Location:
     """Location parameters."""
 
     id: str
     name: str
     district: str
+    _string: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Used as the "strasse" form value, so build it only once.
+        object.__setattr__(self, "_string", f"{self.id}@{self.name}@{self.district}")
 
     def __str__(self):
-        return "@".join(self)
+        return self._string
 
     @classmethod
     def from_string(cls, string: str) -> Location:
         """Parses the location parameters from a string."""
-        return cls(*string.split("@"))
+        location_id, name, district = string.split("@", 2)
+        return cls(location_id, name, intern(district))
 
 
-class Pickup(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class Pickup:
     """Pickup calendar events."""
 
     type: str
@@ -79,15 +84,15 @@ class Pickup(NamedTuple):
     interval: Interval
 
     @classmethod
-    def from_elements(cls, caption: Tag, schedule: Tag) -> Pickup:
+    def from_elements(cls, caption: HtmlElement, schedule: HtmlElement) -> Pickup:
         """Creates a pickup from an element pair."""
-        weekday, dates, interval = schedule.find_all("td")
+        weekday, dates, interval = schedule.findall(".//td")
         return cls(
-            caption.find("strong").text,
-            caption.find("img")["src"],
-            weekday.text,
+            caption.find(".//strong").text_content(),
+            caption.find(".//img").attrib["src"],
+            intern(weekday.text_content()),
             [parse_date(dat) for dat in text_content(dates)],
-            Interval(interval.text),
+            Interval(interval.text_content()),
         )
 
     def to_json(self) -> dict:
@@ -101,7 +106,8 @@ class Pickup(NamedTuple):
         }
 
 
-class Request(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class Request:
     """Pickups request."""
 
     location: Location
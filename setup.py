@@ -7,7 +7,15 @@ setup(
     name="aha",
     use_scm_version={"local_scheme": "node-and-timestamp"},
     setup_requires=["setuptools_scm"],
-    install_requires=["beautifulsoup4", "flask", "hwdb", "mdb", "requests", "wsgilib"],
+    install_requires=[
+        "flask",
+        "hwdb",
+        "lxml",
+        "mdb",
+        "orjson",
+        "requests",
+        "wsgilib",
+    ],
     author="HOMEINFO - Digitale Informationssysteme GmbH",
     author_email="<info at homeinfo dot de>",
     maintainer="Richard Neumann",